@@ -1,203 +1,397 @@
+import os
+import struct
+import tempfile
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import deflate
+import numpy as np
+import pandas as pd
+import gradio as gr
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+import seaborn as sns
+from export_io import save_data_to_disk, _df_to_csv_bytes, _df_to_json_bytes
+from banking_synthetic_data_app import (
+    OUTPUT_DIR, app_state, generate_customer_data, generate_kyc_data,
+    generate_account_data, generate_transaction_data, generate_transfer_data
+)
+
+# libdeflate compression level for the download archives (1-12). Level 6 is the
+# size/speed sweet spot; levels above 10 are much slower for very little gain.
+DEFAULT_COMPRESSION_LEVEL = 6
+
+# Archive members smaller than this are stored uncompressed, since DEFLATE block
+# headers would make them larger rather than smaller
+MIN_DEFLATE_SIZE = 512
+
+# Largest value the classic 32-bit ZIP header fields can hold; sizes and offsets
+# that reach it are written to Zip64 records instead
+ZIP64_LIMIT = 0xFFFFFFFF
+
+# Archive members being encoded or waiting to be written at any one time. Each one
+# holds its serialized and compressed payload until the writer reaches it, and
+# libdeflate only compresses a whole buffer at once, so this trades memory for
+# throughput: two keeps peak memory near the two largest tables (rather than all
+# five) and still overlaps encoding one member with writing the one before it,
+# at the cost of using at most two cores for the encoding.
+MAX_MEMBERS_IN_FLIGHT = 2
+
+# Worker threads that encode archive members, one per member in flight
+ZIP_POOL = ThreadPoolExecutor(max_workers=MAX_MEMBERS_IN_FLIGHT, thread_name_prefix="zip")
+
+# Histogram KDE curves are estimated from a random sample of at most this many rows
+MAX_PLOT_SAMPLE = 10_000
+
 # Add visualization and data exploration functions
-def visualize_customer_age_distribution(customer_data):
+def _plot_sample(data):
+    """Downsample a DataFrame or Series before plotting so the KDE cost stays bounded"""
+    return data.sample(n=min(len(data), MAX_PLOT_SAMPLE), random_state=0)
+
+def _plot_histogram(values, ax, bins=20):
+    """Draw a count histogram with a Gaussian KDE overlay using NumPy"""
+    values = values.dropna()
+    counts, edges = np.histogram(values.to_numpy(dtype=float), bins=bins)
+    widths = np.diff(edges)
+    ax.bar(edges[:-1], counts, width=widths, align="edge", alpha=0.6, edgecolor="black")
+    
+    # KDE with Scott's rule bandwidth on a bounded sample, evaluated on a 200-point grid
+    sample = _plot_sample(values).to_numpy(dtype=float)
+    if len(sample) > 1 and sample.std() > 0:
+        bandwidth = sample.std(ddof=1) * len(sample) ** (-1 / 5)
+        xs = np.linspace(edges[0], edges[-1], 200)
+        density = np.exp(-0.5 * ((xs[:, None] - sample[None, :]) / bandwidth) ** 2).sum(axis=1)
+        density /= len(sample) * bandwidth * np.sqrt(2 * np.pi)
+        ax.plot(xs, density * len(values) * widths[0])
+
+def _category_counts(series):
+    """Count values per category from the categorical codes"""
+    categorical = series.astype("category")
+    codes = categorical.cat.codes.to_numpy()
+    counts = pd.Series(
+        np.bincount(codes[codes >= 0], minlength=len(categorical.cat.categories)), index=categorical.cat.categories
+    )
+    # Generators declare every possible category, so leave out the ones that never occur
+    return counts[counts > 0]
+
+def visualize_customer_age_distribution(customer_data, ax=None):
     """Visualize the age distribution of customers"""
-    plt.figure(figsize=(10, 6))
-    sns.histplot(data=customer_data, x="age", bins=20, kde=True)
-    plt.title("Customer Age Distribution")
-    plt.xlabel("Age")
-    plt.ylabel("Count")
-    return plt
-
-def visualize_income_distribution(customer_data):
+    ax = ax or Figure(figsize=(10, 6)).subplots()
+    _plot_histogram(customer_data["age"], ax)
+    ax.set_title("Customer Age Distribution")
+    ax.set_xlabel("Age")
+    ax.set_ylabel("Count")
+    return ax.figure
+
+def visualize_income_distribution(customer_data, ax=None):
     """Visualize the income distribution of customers"""
-    plt.figure(figsize=(10, 6))
-    sns.histplot(data=customer_data, x="annual_income", bins=20, kde=True)
-    plt.title("Customer Income Distribution")
-    plt.xlabel("Annual Income")
-    plt.ylabel("Count")
-    return plt
-
-def visualize_account_types(account_data):
-    """Visualize the distribution of account types"""
-    plt.figure(figsize=(10, 6))
-    account_counts = account_data["account_type"].value_counts()
-    plt.pie(account_counts, labels=account_counts.index, autopct="%1.1f%%", startangle=90)
-    plt.title("Distribution of Account Types")
-    return plt
-
-def visualize_transaction_types(transaction_data):
-    """Visualize the distribution of transaction types"""
-    plt.figure(figsize=(12, 6))
-    tx_counts = transaction_data["transaction_type"].value_counts()
-    sns.barplot(x=tx_counts.index, y=tx_counts.values)
-    plt.title("Distribution of Transaction Types")
-    plt.xlabel("Transaction Type")
-    plt.ylabel("Count")
-    plt.xticks(rotation=45)
-    return plt
-
-def visualize_kyc_status(kyc_data):
-    """Visualize the distribution of KYC verification statuses"""
-    plt.figure(figsize=(10, 6))
-    status_counts = kyc_data["verification_status"].value_counts()
-    plt.pie(status_counts, labels=status_counts.index, autopct="%1.1f%%", startangle=90)
-    plt.title("Distribution of KYC Verification Statuses")
-    return plt
-
-def visualize_transfer_types(transfer_data):
-    """Visualize the distribution of transfer types"""
-    plt.figure(figsize=(10, 6))
-    transfer_counts = transfer_data["transfer_type"].value_counts()
-    sns.barplot(x=transfer_counts.index, y=transfer_counts.values)
-    plt.title("Distribution of Transfer Types")
-    plt.xlabel("Transfer Type")
-    plt.ylabel("Count")
-    plt.xticks(rotation=45)
-    return plt
-
-def create_csv_files(customer_data, kyc_data, account_data, transaction_data, transfer_data):
-    """Create downloadable CSV files"""
-    customer_csv = customer_data.to_csv(index=False)
-    kyc_csv = kyc_data.to_csv(index=False)
-    account_csv = account_data.to_csv(index=False)
-    transaction_csv = transaction_data.to_csv(index=False)
-    transfer_csv = transfer_data.to_csv(index=False)
+    ax = ax or Figure(figsize=(10, 6)).subplots()
+    _plot_histogram(customer_data["annual_income"], ax)
+    ax.set_title("Customer Income Distribution")
+    ax.set_xlabel("Annual Income")
+    ax.set_ylabel("Count")
+    return ax.figure
+
+def visualize_account_types(account_counts, ax=None):
+    """Visualize the distribution of account types from precomputed counts"""
+    ax = ax or Figure(figsize=(10, 6)).subplots()
+    ax.pie(account_counts, labels=account_counts.index, autopct="%1.1f%%", startangle=90)
+    ax.set_title("Distribution of Account Types")
+    return ax.figure
+
+def visualize_transaction_types(tx_counts, ax=None):
+    """Visualize the distribution of transaction types from precomputed counts"""
+    ax = ax or Figure(figsize=(12, 6)).subplots()
+    sns.barplot(x=tx_counts.index, y=tx_counts.values, ax=ax)
+    ax.set_title("Distribution of Transaction Types")
+    ax.set_xlabel("Transaction Type")
+    ax.set_ylabel("Count")
+    ax.tick_params(axis="x", rotation=45)
+    return ax.figure
+
+def visualize_kyc_status(status_counts, ax=None):
+    """Visualize the distribution of KYC verification statuses from precomputed counts"""
+    ax = ax or Figure(figsize=(10, 6)).subplots()
+    ax.pie(status_counts, labels=status_counts.index, autopct="%1.1f%%", startangle=90)
+    ax.set_title("Distribution of KYC Verification Statuses")
+    return ax.figure
+
+def visualize_transfer_types(transfer_counts, ax=None):
+    """Visualize the distribution of transfer types from precomputed counts"""
+    ax = ax or Figure(figsize=(10, 6)).subplots()
+    sns.barplot(x=transfer_counts.index, y=transfer_counts.values, ax=ax)
+    ax.set_title("Distribution of Transfer Types")
+    ax.set_xlabel("Transfer Type")
+    ax.set_ylabel("Count")
+    ax.tick_params(axis="x", rotation=45)
+    return ax.figure
+
+def _deflate_member(data, level=DEFAULT_COMPRESSION_LEVEL):
+    """Compress one archive member, returning its CRC32, size, ZIP method and payload"""
+    crc = zlib.crc32(data)
+    if len(data) >= MIN_DEFLATE_SIZE:
+        compressed = deflate.deflate_compress(data, level)
+        if len(compressed) < len(data):
+            return crc, len(data), 8, compressed
     
-    # Create a zip file containing all CSVs
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, 'a', zipfile.ZIP_DEFLATED, False) as zip_file:
-        zip_file.writestr("customer_data.csv", customer_csv)
-        zip_file.writestr("kyc_data.csv", kyc_csv)
-        zip_file.writestr("account_data.csv", account_csv)
-        zip_file.writestr("transaction_data.csv", transaction_csv)
-        zip_file.writestr("transfer_data.csv", transfer_csv)
-    
-    return zip_buffer.getvalue()
-
-def create_json_files(customer_data, kyc_data, account_data, transaction_data, transfer_data):
-    """Create downloadable JSON files"""
-    customer_json = customer_data.to_json(orient="records")
-    kyc_json = kyc_data.to_json(orient="records")
-    account_json = account_data.to_json(orient="records")
-    transaction_json = transaction_data.to_json(orient="records")
-    transfer_json = transfer_data.to_json(orient="records")
+    # Tiny or incompressible member: store it as-is (method 0)
+    return crc, len(data), 0, data
+
+def _zip_with_libdeflate(entries, zip_file):
+    """Stream a ZIP archive of members already compressed by _deflate_member into zip_file"""
+    central_directory = []
     
-    # Create a zip file containing all JSONs
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, 'a', zipfile.ZIP_DEFLATED, False) as zip_file:
-        zip_file.writestr("customer_data.json", customer_json)
-        zip_file.writestr("kyc_data.json", kyc_json)
-        zip_file.writestr("account_data.json", account_json)
-        zip_file.writestr("transaction_data.json", transaction_json)
-        zip_file.writestr("transfer_data.json", transfer_json)
-    
-    return zip_buffer.getvalue()
-
-def save_data_to_disk(customer_data, kyc_data, account_data, transaction_data, transfer_data, output_dir=OUTPUT_DIR):
-    """Save all generated data to disk"""
-    try:
-        customer_data.to_csv(f"{output_dir}/customer_data.csv", index=False)
-        kyc_data.to_csv(f"{output_dir}/kyc_data.csv", index=False)
-        account_data.to_csv(f"{output_dir}/account_data.csv", index=False)
-        transaction_data.to_csv(f"{output_dir}/transaction_data.csv", index=False)
-        transfer_data.to_csv(f"{output_dir}/transfer_data.csv", index=False)
+    # ZIP headers store the modification time in MS-DOS format
+    now = time.localtime()
+    dos_time = (now.tm_hour << 11) | (now.tm_min << 5) | (now.tm_sec // 2)
+    dos_date = ((now.tm_year - 1980) << 9) | (now.tm_mon << 5) | now.tm_mday
+    
+    for name, (crc, size, method, payload) in entries:
+        filename = name.encode("utf-8")
+        offset = zip_file.tell()
+        compressed_size = len(payload)
+        
+        # Sizes and offsets that do not fit the 32-bit header fields are marked with
+        # ZIP64_LIMIT there and stored in a Zip64 extra field (version 4.5 to extract)
+        zip64_sizes = size >= ZIP64_LIMIT or compressed_size >= ZIP64_LIMIT
+        version = 45 if zip64_sizes or offset >= ZIP64_LIMIT else 20
+        local_extra = struct.pack("<HHQQ", 0x0001, 16, size, compressed_size) if zip64_sizes else b""
         
-        # Also save as JSON for API-like access
-        customer_data.to_json(f"{output_dir}/customer_data.json", orient="records", indent=2)
-        kyc_data.to_json(f"{output_dir}/kyc_data.json", orient="records", indent=2)
-        account_data.to_json(f"{output_dir}/account_data.json", orient="records", indent=2)
-        transaction_data.to_json(f"{output_dir}/transaction_data.json", orient="records", indent=2)
-        transfer_data.to_json(f"{output_dir}/transfer_data.json", orient="records", indent=2)
+        # Local file header (method 8 = deflate or 0 = stored); its Zip64 field holds both sizes
+        zip_file.write(struct.pack(
+            "<IHHHHHIIIHH", 0x04034B50, version, 0, method, dos_time, dos_date,
+            crc, ZIP64_LIMIT if zip64_sizes else compressed_size, ZIP64_LIMIT if zip64_sizes else size,
+            len(filename), len(local_extra)
+        ))
+        zip_file.write(filename)
+        zip_file.write(local_extra)
+        zip_file.write(payload)
         
-        return True
-    except Exception as e:
-        print(f"Error saving data: {e}")
-        return False
+        # Matching central directory record, written after all members; its Zip64 field
+        # only holds the values that overflow, in size, compressed size, offset order
+        wide = [value for value in (size, compressed_size, offset) if value >= ZIP64_LIMIT]
+        central_extra = struct.pack(f"<HH{len(wide)}Q", 0x0001, 8 * len(wide), *wide) if wide else b""
+        central_directory.append(struct.pack(
+            "<IHHHHHHIIIHHHHHII", 0x02014B50, version, version, 0, method, dos_time, dos_date,
+            crc, min(compressed_size, ZIP64_LIMIT), min(size, ZIP64_LIMIT), len(filename), len(central_extra),
+            0, 0, 0, 0o600 << 16, min(offset, ZIP64_LIMIT)
+        ) + filename + central_extra)
+    
+    cd_offset = zip_file.tell()
+    for record in central_directory:
+        zip_file.write(record)
+    cd_size = zip_file.tell() - cd_offset
+    entry_count = len(central_directory)
+    
+    # Archives whose entry count, directory size or offset overflow the classic end
+    # record also get a Zip64 end of central directory record and its locator
+    if entry_count >= 0xFFFF or cd_size >= ZIP64_LIMIT or cd_offset >= ZIP64_LIMIT:
+        zip64_end_offset = zip_file.tell()
+        zip_file.write(struct.pack(
+            "<IQHHIIQQQQ", 0x06064B50, 44, 45, 45, 0, 0, entry_count, entry_count, cd_size, cd_offset
+        ))
+        zip_file.write(struct.pack("<IIQI", 0x07064B50, 0, zip64_end_offset, 1))
+    
+    # End of central directory record
+    zip_file.write(struct.pack(
+        "<IHHHHIIH", 0x06054B50, 0, 0, min(entry_count, 0xFFFF), min(entry_count, 0xFFFF),
+        min(cd_size, ZIP64_LIMIT), min(cd_offset, ZIP64_LIMIT), 0
+    ))
+
+def _export_zip(jobs, serializer, prefix, level=DEFAULT_COMPRESSION_LEVEL):
+    """Serialize and compress each (filename, DataFrame) job concurrently, writing the ZIP to a temp file"""
+    def encode(job):
+        name, df = job
+        return name, _deflate_member(serializer(df), level)
+    
+    def encoded_members():
+        # The next member is only submitted once an earlier one has been written, so
+        # at most MAX_MEMBERS_IN_FLIGHT payloads are held at a time
+        pending = deque()
+        for job in jobs:
+            if len(pending) == MAX_MEMBERS_IN_FLIGHT:
+                yield pending.popleft().result()
+            pending.append(ZIP_POOL.submit(encode, job))
+        while pending:
+            yield pending.popleft().result()
+    
+    # Arrow, orjson and libdeflate do their work in C, so a member is encoded on a worker
+    # thread while the one before it is written to disk, and the finished archive never
+    # sits in memory.
+    with tempfile.NamedTemporaryFile(prefix=prefix, suffix=".zip", delete=False) as zip_file:
+        _zip_with_libdeflate(encoded_members(), zip_file)
+    
+    return zip_file.name
+
+def _discard_export(path):
+    """Remove a previously built export archive from disk"""
+    if path is not None and os.path.exists(path):
+        os.remove(path)
+
+def create_csv_files(customer_data, kyc_data, account_data, transaction_data, transfer_data, level=DEFAULT_COMPRESSION_LEVEL):
+    """Create downloadable CSV files, returning the path of the ZIP archive"""
+    jobs = [
+        ("customer_data.csv", customer_data),
+        ("kyc_data.csv", kyc_data),
+        ("account_data.csv", account_data),
+        ("transaction_data.csv", transaction_data),
+        ("transfer_data.csv", transfer_data)
+    ]
+    
+    # Create a zip file containing all CSVs
+    return _export_zip(jobs, _df_to_csv_bytes, "banking_data_csv_", level=level)
+
+def create_json_files(customer_data, kyc_data, account_data, transaction_data, transfer_data, level=DEFAULT_COMPRESSION_LEVEL):
+    """Create downloadable JSON files, returning the path of the ZIP archive"""
+    jobs = [
+        ("customer_data.json", customer_data),
+        ("kyc_data.json", kyc_data),
+        ("account_data.json", account_data),
+        ("transaction_data.json", transaction_data),
+        ("transfer_data.json", transfer_data)
+    ]
+    
+    # Create a zip file containing all JSONs
+    return _export_zip(jobs, _df_to_json_bytes, "banking_data_json_", level=level)
 
 # UI Functions
 def generate_data(num_customers, avg_accounts, avg_transactions, num_transfers, progress=gr.Progress()):
     """Generate synthetic banking data with progress tracking"""
-    global app_state
+    # Only forward progress updates that are at least 0.1s apart to cut Gradio queue events
+    last_update = [float("-inf")]
+    def report(fraction, desc):
+        now = time.monotonic()
+        if fraction >= 1.0 or now - last_update[0] > 0.1:
+            progress(fraction, desc=desc)
+            last_update[0] = now
     
-    progress(0, desc="Starting data generation...")
+    report(0, desc="Starting data generation...")
     start_time = time.time()
     
+    # Results are collected locally and published to app_state in a single update at the end
+    stats = {}
+    state = {}
+    
     # Generate customer data
-    progress(0.1, desc="Generating customer data...")
+    report(0.1, desc="Generating customer data...")
     customer_data = generate_customer_data(num_customers=num_customers)
-    app_state.customer_data = customer_data
-    app_state.generation_stats["customers"] = len(customer_data)
+    state["customer_data"] = customer_data
+    stats["customers"] = len(customer_data)
     
     # Generate KYC data
-    progress(0.25, desc="Generating KYC data...")
+    report(0.25, desc="Generating KYC data...")
     kyc_data = generate_kyc_data(customer_data)
-    app_state.kyc_data = kyc_data
-    app_state.generation_stats["kyc"] = len(kyc_data)
+    state["kyc_data"] = kyc_data
+    state["kyc_status_counts"] = _category_counts(kyc_data["verification_status"])
+    stats["kyc"] = len(kyc_data)
     
     # Generate account data
-    progress(0.4, desc="Generating account data...")
+    report(0.4, desc="Generating account data...")
     account_data = generate_account_data(customer_data, avg_accounts_per_customer=avg_accounts)
-    app_state.account_data = account_data
-    app_state.generation_stats["accounts"] = len(account_data)
+    state["account_data"] = account_data
+    state["account_type_counts"] = _category_counts(account_data["account_type"])
+    stats["accounts"] = len(account_data)
     
     # Generate transaction data
-    progress(0.6, desc="Generating transaction data...")
+    report(0.6, desc="Generating transaction data...")
     transaction_data = generate_transaction_data(account_data, avg_transactions_per_account=avg_transactions)
-    app_state.transaction_data = transaction_data
-    app_state.generation_stats["transactions"] = len(transaction_data)
+    state["transaction_data"] = transaction_data
+    state["transaction_type_counts"] = _category_counts(transaction_data["transaction_type"])
+    stats["transactions"] = len(transaction_data)
     
     # Generate transfer data
-    progress(0.8, desc="Generating transfer data...")
+    report(0.8, desc="Generating transfer data...")
     transfer_data = generate_transfer_data(account_data, customer_data, num_transfers=num_transfers)
-    app_state.transfer_data = transfer_data
-    app_state.generation_stats["transfers"] = len(transfer_data)
+    state["transfer_data"] = transfer_data
+    state["transfer_type_counts"] = _category_counts(transfer_data["transfer_type"])
+    stats["transfers"] = len(transfer_data)
     
     # Save data to disk
-    progress(0.9, desc="Saving data...")
+    report(0.9, desc="Saving data...")
     save_data_to_disk(customer_data, kyc_data, account_data, transaction_data, transfer_data)
     
+    # Build the download archives once so the download buttons return cached files
+    report(0.95, desc="Preparing downloads...")
+    state["csv_zip_path"] = create_csv_files(customer_data, kyc_data, account_data, transaction_data, transfer_data)
+    state["json_zip_path"] = create_json_files(customer_data, kyc_data, account_data, transaction_data, transfer_data)
+    state["csv_zip_level"] = DEFAULT_COMPRESSION_LEVEL
+    state["json_zip_level"] = DEFAULT_COMPRESSION_LEVEL
+    
     end_time = time.time()
     generation_time = round(end_time - start_time, 2)
-    app_state.generation_stats["generation_time"] = generation_time
+    stats["generation_time"] = generation_time
     
-    progress(1.0, desc="Data generation complete!")
+    # Publish the new generation, then drop the export archives it replaces
+    previous_exports = (app_state.csv_zip_path, app_state.json_zip_path)
+    state["generation_stats"] = stats
+    app_state.__dict__.update(state)
+    for path in previous_exports:
+        _discard_export(path)
+    
+    report(1.0, desc="Data generation complete!")
     
     # Create summary
     summary = f"""
     ## Banking Synthetic Data Generation Summary
     
-    - **Customers**: {app_state.generation_stats.get('customers', 0)}
-    - **KYC Records**: {app_state.generation_stats.get('kyc', 0)}
-    - **Accounts**: {app_state.generation_stats.get('accounts', 0)}
-    - **Transactions**: {app_state.generation_stats.get('transactions', 0)}
-    - **Transfers**: {app_state.generation_stats.get('transfers', 0)}
-    - **Generation Time**: {app_state.generation_stats.get('generation_time', 0)} seconds
+    - **Customers**: {stats.get('customers', 0)}
+    - **KYC Records**: {stats.get('kyc', 0)}
+    - **Accounts**: {stats.get('accounts', 0)}
+    - **Transactions**: {stats.get('transactions', 0)}
+    - **Transfers**: {stats.get('transfers', 0)}
+    - **Generation Time**: {stats.get('generation_time', 0)} seconds
     
     Data has been saved to the `{OUTPUT_DIR}` directory.
     """
     
     return summary
 
+def _render_rgba(fig):
+    """Rasterize a Figure once with Agg and return its RGBA pixels for gr.Image"""
+    canvas = FigureCanvasAgg(fig)
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba())
+
 def update_visualizations():
     """Update all visualizations based on current data"""
     if app_state.customer_data is None:
-        return None, None, None, None, None, None
+        return None
     
-    age_plot = visualize_customer_age_distribution(app_state.customer_data)
-    income_plot = visualize_income_distribution(app_state.customer_data)
-    account_plot = visualize_account_types(app_state.account_data)
-    transaction_plot = visualize_transaction_types(app_state.transaction_data)
-    kyc_plot = visualize_kyc_status(app_state.kyc_data)
-    transfer_plot = visualize_transfer_types(app_state.transfer_data)
+    # Release anything left in pyplot's figure registry from earlier refreshes
+    plt.close("all")
     
-    return age_plot, income_plot, account_plot, transaction_plot, kyc_plot, transfer_plot
+    # Draw every chart onto one 3x2 grid instead of six separate figures. The Figure
+    # is built directly rather than through pyplot, so it is never registered there.
+    fig = Figure(figsize=(20, 18), dpi=90)
+    axes = fig.subplots(3, 2)
+    visualize_customer_age_distribution(app_state.customer_data, ax=axes[0, 0])
+    visualize_income_distribution(app_state.customer_data, ax=axes[0, 1])
+    visualize_account_types(app_state.account_type_counts, ax=axes[1, 0])
+    visualize_kyc_status(app_state.kyc_status_counts, ax=axes[1, 1])
+    visualize_transaction_types(app_state.transaction_type_counts, ax=axes[2, 0])
+    visualize_transfer_types(app_state.transfer_type_counts, ax=axes[2, 1])
+    fig.tight_layout()
+    
+    return _render_rgba(fig)
+
+def _head_md(df, n=5):
+    """Format the first n rows of a DataFrame as a markdown pipe table"""
+    header = [str(column) for column in df.columns]
+    rows = df.head(n).astype(str).values.tolist()
+    lines = ["| " + " | ".join(header) + " |", "|" + "---|" * len(header)]
+    lines.extend("| " + " | ".join(value.replace("|", "\\|") for value in row) + " |" for row in rows)
+    return "\n".join(lines)
 
 def get_customer_sample():
     """Get a formatted sample of customer data"""
     if app_state.customer_data is None:
         return "No data generated yet."
     
-    sample = app_state.customer_data.head(5).to_markdown()
+    sample = _head_md(app_state.customer_data)
     return f"## Customer Data Sample\n\n{sample}"
 
 def get_kyc_sample():
@@ -205,7 +399,7 @@ def get_kyc_sample():
     if app_state.kyc_data is None:
         return "No data generated yet."
     
-    sample = app_state.kyc_data.head(5).to_markdown()
+    sample = _head_md(app_state.kyc_data)
     return f"## KYC Data Sample\n\n{sample}"
 
 def get_account_sample():
@@ -213,7 +407,7 @@ def get_account_sample():
     if app_state.account_data is None:
         return "No data generated yet."
     
-    sample = app_state.account_data.head(5).to_markdown()
+    sample = _head_md(app_state.account_data)
     return f"## Account Data Sample\n\n{sample}"
 
 def get_transaction_sample():
@@ -221,7 +415,7 @@ def get_transaction_sample():
     if app_state.transaction_data is None:
         return "No data generated yet."
     
-    sample = app_state.transaction_data.head(5).to_markdown()
+    sample = _head_md(app_state.transaction_data)
     return f"## Transaction Data Sample\n\n{sample}"
 
 def get_transfer_sample():
@@ -229,34 +423,48 @@ def get_transfer_sample():
     if app_state.transfer_data is None:
         return "No data generated yet."
     
-    sample = app_state.transfer_data.head(5).to_markdown()
+    sample = _head_md(app_state.transfer_data)
     return f"## Transfer Data Sample\n\n{sample}"
 
-def get_csv_download():
-    """Prepare CSV files for download"""
+def get_csv_download(level=DEFAULT_COMPRESSION_LEVEL):
+    """Prepare CSV files for download, rebuilding the cached archive only if the level changed"""
     if app_state.customer_data is None:
         return None
     
-    return create_csv_files(
-        app_state.customer_data,
-        app_state.kyc_data,
-        app_state.account_data,
-        app_state.transaction_data,
-        app_state.transfer_data
-    )
+    level = int(level)
+    if app_state.csv_zip_level != level:
+        _discard_export(app_state.csv_zip_path)
+        app_state.csv_zip_path = create_csv_files(
+            app_state.customer_data,
+            app_state.kyc_data,
+            app_state.account_data,
+            app_state.transaction_data,
+            app_state.transfer_data,
+            level=level
+        )
+        app_state.csv_zip_level = level
+    
+    return app_state.csv_zip_path
 
-def get_json_download():
-    """Prepare JSON files for download"""
+def get_json_download(level=DEFAULT_COMPRESSION_LEVEL):
+    """Prepare JSON files for download, rebuilding the cached archive only if the level changed"""
     if app_state.customer_data is None:
         return None
     
-    return create_json_files(
-        app_state.customer_data,
-        app_state.kyc_data,
-        app_state.account_data,
-        app_state.transaction_data,
-        app_state.transfer_data
-    )
+    level = int(level)
+    if app_state.json_zip_level != level:
+        _discard_export(app_state.json_zip_path)
+        app_state.json_zip_path = create_json_files(
+            app_state.customer_data,
+            app_state.kyc_data,
+            app_state.account_data,
+            app_state.transaction_data,
+            app_state.transfer_data,
+            level=level
+        )
+        app_state.json_zip_level = level
+    
+    return app_state.json_zip_path
 
 # Create the Gradio interface
 def create_app():
@@ -324,22 +532,12 @@ def create_app():
         with gr.Tab("Visualizations"):
             refresh_viz_btn = gr.Button("Refresh Visualizations")
             
-            with gr.Row():
-                age_plot = gr.Plot(label="Customer Age Distribution")
-                income_plot = gr.Plot(label="Customer Income Distribution")
-            
-            with gr.Row():
-                account_plot = gr.Plot(label="Account Types Distribution")
-                kyc_plot = gr.Plot(label="KYC Status Distribution")
-            
-            with gr.Row():
-                transaction_plot = gr.Plot(label="Transaction Types Distribution")
-                transfer_plot = gr.Plot(label="Transfer Types Distribution")
+            overview_plot = gr.Image(label="Customer, Account, KYC, Transaction and Transfer Distributions", type="numpy")
             
             refresh_viz_btn.click(
                 fn=update_visualizations,
                 inputs=[],
-                outputs=[age_plot, income_plot, account_plot, transaction_plot, kyc_plot, transfer_plot]
+                outputs=[overview_plot]
             )
         
         with gr.Tab("Data Samples"):
@@ -379,6 +577,15 @@ def create_app():
             Download all the synthetic data as CSV or JSON files. The files will be packaged in a ZIP archive.
             """)
             
+            compression_level = gr.Slider(
+                label="Compression Level",
+                info="Level 6 balances size and speed; levels above 10 are much slower for little extra compression",
+                minimum=1,
+                maximum=12,
+                value=DEFAULT_COMPRESSION_LEVEL,
+                step=1
+            )
+            
             with gr.Row():
                 csv_btn = gr.Button("Download as CSV")
                 json_btn = gr.Button("Download as JSON")
@@ -387,8 +594,8 @@ def create_app():
                 csv_download = gr.File(label="CSV Download")
                 json_download = gr.File(label="JSON Download")
             
-            csv_btn.click(fn=get_csv_download, inputs=[], outputs=[csv_download])
-            json_btn.click(fn=get_json_download, inputs=[], outputs=[json_download])
+            csv_btn.click(fn=get_csv_download, inputs=[compression_level], outputs=[csv_download])
+            json_btn.click(fn=get_json_download, inputs=[compression_level], outputs=[json_download])
         
         with gr.Tab("API Documentation"):
             gr.Markdown("""
@@ -396,6 +603,8 @@ def create_app():
             
             This synthetic data generator also creates JSON files that can be used as a mock API. The data is stored in the `synthetic_data_output` directory.
             
+            The files use line-delimited JSON: each line is one compact JSON record. (The JSON download on the Download Data tab contains regular JSON arrays.)
+            
             ## Available Endpoints
             
             - `/customer_data.json` - Customer profiles with personal information
@@ -421,16 +630,16 @@ def create_app():
             base_url = "http://your-server/synthetic_data_output"
             
             # Get customer data
-            customers = pd.read_json(f"{base_url}/customer_data.json")
+            customers = pd.read_json(f"{base_url}/customer_data.json", lines=True)
             
             # Get accounts for a specific customer
             customer_id = customers.iloc[0]["customer_id"]
-            accounts = pd.read_json(f"{base_url}/account_data.json")
+            accounts = pd.read_json(f"{base_url}/account_data.json", lines=True)
             customer_accounts = accounts[accounts["customer_id"] == customer_id]
             
             # Get transactions for a specific account
             account_id = customer_accounts.iloc[0]["account_id"]
-            transactions = pd.read_json(f"{base_url}/transaction_data.json")
+            transactions = pd.read_json(f"{base_url}/transaction_data.json", lines=True)
             account_transactions = transactions[transactions["account_id"] == account_id]
             ```
             
@@ -0,0 +1,97 @@
+import pathlib
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pacsv
+import pyarrow.parquet as pq
+from banking_synthetic_data_app import OUTPUT_DIR, PARQUET_COMPRESSION
+
+# Table serializers and disk writers shared by the UI and the headless command, kept
+# apart from banking_app_ui so writing files never imports gradio or matplotlib
+
+# Shared worker threads that serialize and write the output files, reused across saves
+EXPORT_POOL = ThreadPoolExecutor(max_workers=10, thread_name_prefix="export")
+
+def _df_to_csv_bytes(df):
+    """Serialize a DataFrame to CSV with the Arrow CSV writer, returning the Arrow buffer without copying"""
+    sink = pa.BufferOutputStream()
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), sink)
+    return sink.getvalue()
+
+def _write_csv(path, df):
+    """Write a DataFrame to disk as CSV with the Arrow CSV writer"""
+    pacsv.write_csv(
+        pa.Table.from_pandas(df, preserve_index=False),
+        path,
+        write_options=pacsv.WriteOptions(batch_size=65536)
+    )
+
+def _write_parquet(path, df):
+    """Write a DataFrame to disk as a zstd-compressed Parquet file"""
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), path, compression=PARQUET_COMPRESSION)
+
+def _column_values(series):
+    """List a column's values, turning missing Arrow-backed strings, dates and categories into None"""
+    if isinstance(series.dtype, (pd.StringDtype, pd.ArrowDtype, pd.CategoricalDtype)):
+        return series.to_numpy(dtype=object, na_value=None).tolist()
+    return series.tolist()
+
+def _df_records(df):
+    """Build the list of record dicts from whole-column tolist() calls instead of to_dict's per-value boxing"""
+    columns = df.columns.tolist()
+    return [dict(zip(columns, row)) for row in zip(*(_column_values(df[column]) for column in columns))]
+
+def _df_to_json_bytes(df):
+    """Serialize a DataFrame to a JSON array of records as UTF-8 bytes"""
+    return orjson.dumps(_df_records(df), option=orjson.OPT_SERIALIZE_NUMPY)
+
+def _df_to_ndjson_bytes(df):
+    """Serialize a DataFrame to line-delimited JSON, one compact record per line"""
+    option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+    return b"".join(orjson.dumps(record, option=option) for record in _df_records(df))
+
+def _write_json(path, df):
+    """Write a DataFrame to disk as line-delimited JSON records"""
+    # orjson already returns UTF-8 bytes, so write them through a binary file with a 1 MiB buffer
+    with open(path, "wb", buffering=1 << 20) as f:
+        f.write(_df_to_ndjson_bytes(df))
+
+def save_data_to_disk(customer_data, kyc_data, account_data, transaction_data, transfer_data, output_dir=OUTPUT_DIR, parquet=False):
+    """Save all generated data to disk, adding Parquet copies of each table when parquet is set"""
+    out = pathlib.Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    
+    jobs = [
+        (_write_csv, out / "customer_data.csv", customer_data),
+        (_write_csv, out / "kyc_data.csv", kyc_data),
+        (_write_csv, out / "account_data.csv", account_data),
+        (_write_csv, out / "transaction_data.csv", transaction_data),
+        (_write_csv, out / "transfer_data.csv", transfer_data),
+        
+        # Also save as JSON for API-like access
+        (_write_json, out / "customer_data.json", customer_data),
+        (_write_json, out / "kyc_data.json", kyc_data),
+        (_write_json, out / "account_data.json", account_data),
+        (_write_json, out / "transaction_data.json", transaction_data),
+        (_write_json, out / "transfer_data.json", transfer_data)
+    ]
+    
+    # Columnar copies for analytics tools
+    if parquet:
+        jobs += [
+            (_write_parquet, out / "customer_data.parquet", customer_data),
+            (_write_parquet, out / "kyc_data.parquet", kyc_data),
+            (_write_parquet, out / "account_data.parquet", account_data),
+            (_write_parquet, out / "transaction_data.parquet", transaction_data),
+            (_write_parquet, out / "transfer_data.parquet", transfer_data)
+        ]
+    
+    try:
+        # Encoding and file I/O for each file overlap on the writer threads
+        list(EXPORT_POOL.map(lambda job: job[0](job[1], job[2]), jobs))
+        
+        return True
+    except Exception as e:
+        print(f"Error saving data: {e}")
+        return False
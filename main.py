@@ -15,23 +15,19 @@ Date: March 25, 2025
 
 import os
 import sys
-import pandas as pd
-from banking_synthetic_data_app import *
-from banking_app_ui import create_app
+import importlib.util
+import time
 
 def check_dependencies():
     """Check if all required dependencies are installed"""
     required_packages = [
         "gradio", "pandas", "numpy", "faker", "mimesis", 
-        "matplotlib", "seaborn", "tabulate"
+        "matplotlib", "seaborn", "deflate", "orjson", "pyarrow",
+        "numba"
     ]
     
-    missing_packages = []
-    for package in required_packages:
-        try:
-            __import__(package)
-        except ImportError:
-            missing_packages.append(package)
+    # Only look the packages up; importing them here would run their initialization
+    missing_packages = [package for package in required_packages if importlib.util.find_spec(package) is None]
     
     if missing_packages:
         print("Missing required packages. Please install:")
@@ -42,27 +38,36 @@ def check_dependencies():
 
 def setup_environment():
     """Setup the environment for the application"""
-    # Create output directory if it doesn't exist
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    # Nothing here imports the generator module, so an unknown command returns
+    # without paying for it; each command creates its output directory itself
     
     # Set up logging if needed
     # (Add logging setup here if required)
     
     return True
 
-def run_headless(args):
-    """Run the application in headless mode (no UI)"""
+def parse_generation_args(args):
+    """Parse the positional generation parameters shared by the headless and stream commands"""
+    # An optional --seed N makes the run reproducible; it is taken out before the positional parameters
+    seed = None
+    if "--seed" in args:
+        index = args.index("--seed")
+        try:
+            seed = int(args[index + 1])
+        except (IndexError, ValueError):
+            print("Error: --seed must be followed by an integer")
+            return None
+        args = args[:index] + args[index + 2:]
+    
     if len(args) < 2:
-        print("Usage: python main.py headless <num_customers>")
-        return False
+        print(f"Usage: python main.py {args[0]} <num_customers> [avg_accounts] [avg_transactions] [num_transfers] [--seed N]")
+        return None
     
     try:
         num_customers = int(args[1])
     except ValueError:
         print("Error: Number of customers must be an integer")
-        return False
-    
-    print(f"Generating synthetic data for {num_customers} customers...")
+        return None
     
     # Default parameters
     avg_accounts = 1.5
@@ -88,26 +93,64 @@ def run_headless(args):
         except ValueError:
             print("Warning: Invalid num_transfers parameter, using default (200)")
     
+    return num_customers, avg_accounts, avg_transactions, num_transfers, seed
+
+def seeded_generators(seed, count):
+    """Reseed the provider libraries from SeedSequence(seed) and spawn count independent NumPy generators from it"""
+    import numpy as np
+    from banking_synthetic_data_app import reseed
+    
+    seed_seq = np.random.SeedSequence(seed)
+    reseed(seed_seq)
+    return [np.random.default_rng(child) for child in seed_seq.spawn(count)]
+
+def run_headless(args):
+    """Run the application in headless mode (no UI)"""
+    params = parse_generation_args(args)
+    if params is None:
+        return False
+    num_customers, avg_accounts, avg_transactions, num_transfers, seed = params
+    
+    # The generators and the file writers are only imported once the dependency
+    # check has passed and a command needs them
+    from banking_synthetic_data_app import (
+        OUTPUT_DIR, generate_customer_data, generate_kyc_data, generate_account_data,
+        generate_transaction_data, generate_transfer_data
+    )
+    from export_io import save_data_to_disk
+    
+    # Create output directory if it doesn't exist
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    
+    # Each table gets its own child stream of the seed; without one the module's fixed seed is used
+    customer_rng, kyc_rng, account_rng, transaction_rng, transfer_rng = (
+        [None] * 5 if seed is None else seeded_generators(seed, 5)
+    )
+    
+    print(f"Generating synthetic data for {num_customers} customers...")
+    
     # Generate data
     start_time = time.time()
     
     print("Generating customer data...")
-    customer_data = generate_customer_data(num_customers=num_customers)
+    customer_data = generate_customer_data(num_customers=num_customers, rng=customer_rng)
     
     print("Generating KYC data...")
-    kyc_data = generate_kyc_data(customer_data)
+    kyc_data = generate_kyc_data(customer_data, rng=kyc_rng)
     
     print("Generating account data...")
-    account_data = generate_account_data(customer_data, avg_accounts_per_customer=avg_accounts)
+    account_data = generate_account_data(customer_data, avg_accounts_per_customer=avg_accounts, rng=account_rng)
     
     print("Generating transaction data...")
-    transaction_data = generate_transaction_data(account_data, avg_transactions_per_account=avg_transactions)
+    transaction_data = generate_transaction_data(
+        account_data, avg_transactions_per_account=avg_transactions, rng=transaction_rng
+    )
     
     print("Generating transfer data...")
-    transfer_data = generate_transfer_data(account_data, customer_data, num_transfers=num_transfers)
+    transfer_data = generate_transfer_data(account_data, customer_data, num_transfers=num_transfers, rng=transfer_rng)
     
     print("Saving data...")
-    save_data_to_disk(customer_data, kyc_data, account_data, transaction_data, transfer_data)
+    save_data_to_disk(customer_data, kyc_data, account_data, transaction_data, transfer_data, parquet=True)
     
     end_time = time.time()
     generation_time = round(end_time - start_time, 2)
@@ -123,8 +166,46 @@ def run_headless(args):
     
     return True
 
+def run_stream(args):
+    """Run the application in headless mode, streaming each table to Parquet in customer chunks"""
+    params = parse_generation_args(args)
+    if params is None:
+        return False
+    num_customers, avg_accounts, avg_transactions, num_transfers, seed = params
+    
+    from banking_synthetic_data_app import PARQUET_CHUNK_SIZE, stream_to_parquet
+    
+    # Chunks are generated one after another, so the whole run draws from a single stream of the seed
+    rng = None if seed is None else seeded_generators(seed, 1)[0]
+    
+    print(f"Streaming synthetic data for {num_customers} customers in chunks of {PARQUET_CHUNK_SIZE}...")
+    start_time = time.time()
+    paths, counts = stream_to_parquet(
+        num_customers=num_customers,
+        avg_accounts_per_customer=avg_accounts,
+        avg_transactions_per_account=avg_transactions,
+        num_transfers=num_transfers,
+        rng=rng
+    )
+    generation_time = round(time.time() - start_time, 2)
+    
+    print("\nData generation complete!")
+    print(f"Generation time: {generation_time} seconds")
+    print(f"Customers: {counts['customer']}")
+    print(f"KYC records: {counts['kyc']}")
+    print(f"Accounts: {counts['account']}")
+    print(f"Transactions: {counts['transaction']}")
+    print(f"Transfers: {counts['transfer']}")
+    print("\nData saved to:")
+    for path in paths.values():
+        print(f"  {os.path.abspath(path)}")
+    
+    return True
+
 def run_ui():
     """Run the application with Gradio UI"""
+    from banking_app_ui import create_app
+    
     app = create_app()
     print("Starting Banking Synthetic Data Generator UI...")
     app.launch(server_name="0.0.0.0")
@@ -144,9 +225,11 @@ def main():
     if len(sys.argv) > 1:
         if sys.argv[1] == "headless":
             return run_headless(sys.argv[1:])
+        elif sys.argv[1] == "stream":
+            return run_stream(sys.argv[1:])
         else:
             print(f"Unknown command: {sys.argv[1]}")
-            print("Available commands: headless")
+            print("Available commands: headless, stream")
             return False
     
     # Default: Run with UI
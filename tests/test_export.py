@@ -0,0 +1,14 @@
+"""Tests for the ZIP archives built for the download buttons"""
+import io
+import zipfile
+
+from banking_app_ui import _deflate_member, _zip_with_libdeflate
+
+def test_archive_past_classic_entry_limit_reads_back():
+    """More entries than the classic end record can count are recorded in the Zip64 end record"""
+    buffer = io.BytesIO()
+    _zip_with_libdeflate(((f"member_{i}.txt", _deflate_member(b"row %d" % i)) for i in range(0x10000 + 10)), buffer)
+    archive = zipfile.ZipFile(buffer)
+    assert len(archive.infolist()) == 0x10000 + 10
+    assert archive.testzip() is None
+    assert archive.read("member_65545.txt") == b"row 65545"
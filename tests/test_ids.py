@@ -0,0 +1,33 @@
+"""Tests for drawing unique customer and account IDs"""
+import tracemalloc
+
+import numpy as np
+
+from banking_synthetic_data_app import AccountGenerator, CustomerGenerator, _unique_numbers
+
+def test_large_draws_are_unique_and_in_range():
+    """Draws well past 1/50 of the range, where rng.choice would permute the whole population, stay unique"""
+    rng = np.random.default_rng(3)
+    low, high = CustomerGenerator.id_range
+    numbers = _unique_numbers(rng, low, high, 1_000_000)
+    assert len(np.unique(numbers)) == len(numbers)
+    assert numbers.min() >= low and numbers.max() <= high
+    
+    # Drawing the whole range gives every number exactly once
+    assert np.array_equal(np.sort(_unique_numbers(rng, 100, 999, 900)), np.arange(100, 1000))
+
+def test_large_draws_do_not_build_the_population():
+    """Drawing 2M account numbers only allocates memory in proportion to the draw, not the 90M range"""
+    tracemalloc.start()
+    try:
+        _unique_numbers(np.random.default_rng(3), *AccountGenerator.id_range, 2_000_000)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert peak < 2_000_000 * 16
+
+def test_generated_ids_are_prefixed_and_unique():
+    """Customer IDs keep their prefix and fixed width at a size above 1/50 of the range"""
+    ids = CustomerGenerator.generate_customer_ids(200_000, np.random.default_rng(3))
+    assert len(set(ids)) == len(ids)
+    assert all(customer_id.startswith("CUST") and len(customer_id) == 11 for customer_id in ids[:1000])
@@ -0,0 +1,48 @@
+"""Regression tests for generating large batches across worker processes"""
+import os
+import subprocess
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs the parallel numba kernels in the parent, then shards transactions over
+# SHARD_TEST_CPUS workers whatever the machine has, and exits
+SHARDED_RUN = """
+import os
+os.cpu_count = lambda: int(os.environ["SHARD_TEST_CPUS"])
+import hashlib
+import numpy as np
+import banking_synthetic_data_app as app
+
+# Smaller shards than the real thresholds keep the run short
+app.PARALLEL_MIN_CUSTOMERS = app.PARALLEL_MIN_ACCOUNTS = 20_000
+
+if __name__ == "__main__":
+    rng = app.reseed(np.random.SeedSequence(7))
+    customers = app.generate_customer_data(num_customers=20_000, rng=rng)
+    accounts = app.generate_account_data(customers, rng=rng)
+    assert len(accounts) >= 20_000
+    transactions = app.generate_transaction_data(accounts, avg_transactions_per_account=2, rng=rng)
+    # Transfers sample provider values after both sharded steps, so they show
+    # whether sharding left the parent's provider state alone
+    transfers = app.generate_transfer_data(accounts, customers, num_transfers=500, rng=rng)
+    for frame in (customers, accounts, transactions, transfers):
+        print(hashlib.sha256(frame.to_csv(index=False).encode()).hexdigest())
+"""
+
+def _sharded_run(cpus):
+    """Run the sharded generation in a fresh interpreter, returning a digest per table"""
+    result = subprocess.run(
+        [sys.executable, "-c", SHARDED_RUN], cwd=REPO_DIR, capture_output=True, text=True, timeout=300,
+        env={**os.environ, "SHARD_TEST_CPUS": str(cpus)}
+    )
+    assert result.returncode == 0, result.stderr
+    return result.stdout.split()[-4:]
+
+def test_sharded_transactions_exit_after_parallel_kernels():
+    """A sharded run must not hang at exit after the parent has started numba's worker threads"""
+    assert len(_sharded_run(4)) == 4
+
+def test_seeded_shards_do_not_depend_on_cpu_count():
+    """The same seed gives the same rows whether the shards run in the calling process or on several workers"""
+    assert _sharded_run(1) == _sharded_run(4)
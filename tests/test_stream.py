@@ -0,0 +1,27 @@
+"""Tests for streaming the generated tables to Parquet in customer chunks"""
+import pyarrow.parquet as pq
+import pytest
+
+from banking_synthetic_data_app import stream_to_parquet
+
+def test_final_chunk_transfers_are_not_dropped(tmp_path):
+    """A final chunk too small to take its share of transfers hands it back to an earlier chunk"""
+    # One account per customer, so the 1-customer final chunk can never take transfers
+    paths, counts = stream_to_parquet(
+        num_customers=101, avg_accounts_per_customer=1, num_transfers=200, chunk_size=50, output_dir=tmp_path
+    )
+    assert counts["transfer"] == 200
+    assert pq.read_metadata(paths["transfer"]).num_rows == 200
+
+def test_transfers_without_eligible_chunk_raise(tmp_path):
+    """A run where no chunk has two active accounts reports the shortfall instead of writing fewer transfers"""
+    with pytest.raises(ValueError, match="10 of 10 transfers"):
+        stream_to_parquet(num_customers=1, avg_accounts_per_customer=1, num_transfers=10, output_dir=tmp_path)
+
+def test_ids_stay_unique_across_chunks(tmp_path):
+    """Customer and account IDs built chunk by chunk never repeat across the run"""
+    paths, counts = stream_to_parquet(num_customers=2000, num_transfers=0, chunk_size=300, output_dir=tmp_path)
+    customer_ids = pq.read_table(paths["customer"], columns=["customer_id"]).column(0).to_pylist()
+    account_ids = pq.read_table(paths["account"], columns=["account_id"]).column(0).to_pylist()
+    assert len(set(customer_ids)) == counts["customer"] == 2000
+    assert len(set(account_ids)) == counts["account"]
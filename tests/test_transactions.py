@@ -0,0 +1,57 @@
+"""Tests for sizing transaction amounts against each account's running balance"""
+import numpy as np
+
+from banking_synthetic_data_app import _apply_transactions
+
+def _baseline_transactions(opening_balance, interest_rate, offsets, tx_type, uniforms, sign, status):
+    """The original per-row loop, fed the kernel's draws: uniforms[i] stands in for random.uniform"""
+    amounts, running_balances = [], []
+    for a in range(len(offsets) - 1):
+        running_balance = opening_balance[a]
+        for i in range(offsets[a], offsets[a + 1]):
+            def uniform(min_amount, max_amount):
+                return min_amount + uniforms[i] * (max_amount - min_amount)
+            if tx_type[i] == 0:  # Deposit
+                amount = round(uniform(10, 5000), 2)
+            elif tx_type[i] == 1:  # Withdrawal
+                amount = round(uniform(10, max(min(running_balance * 0.5, 1000), 10)), 2)
+            elif tx_type[i] == 2:  # Transfer
+                amount = round(uniform(50, max(min(running_balance * 0.7, 3000), 50)), 2)
+            elif tx_type[i] == 3:  # Payment
+                amount = round(uniform(10, max(min(running_balance * 0.4, 2000), 10)), 2)
+            elif tx_type[i] == 4:  # Fee
+                amount = round(uniform(1, 50), 2)
+            elif interest_rate[a]:  # Interest
+                amount = round(running_balance * interest_rate[a] / 12, 2)
+            else:
+                amount = round(running_balance * 0.0025, 2)
+            new_balance = running_balance + amount * sign[i]
+            amounts.append(abs(amount))
+            if status[i] == 0:  # Completed
+                running_balances.append(round(new_balance, 2))
+                running_balance = new_balance
+            else:
+                running_balances.append(round(running_balance, 2))
+    return np.array(amounts), np.array(running_balances)
+
+def test_kernel_matches_the_original_balance_loop():
+    """On a fixed seed the kernel gives the amounts and running balances of the loop it replaced"""
+    rng = np.random.default_rng(11)
+    accounts = 2_000
+    # Small balances push the withdrawal, transfer and payment caps below their minimums
+    opening_balance = np.round(rng.choice([0.0, 15.0, 80.0, 5_000.0, 250_000.0], accounts) * rng.random(accounts), 2)
+    interest_rate = np.where(rng.random(accounts) < 0.5, 0.0, np.round(rng.random(accounts) * 0.05, 4))
+    offsets = np.concatenate(([0], np.cumsum(rng.poisson(20, accounts))))
+    total = offsets[-1]
+    tx_type = rng.choice(6, size=total, p=[0.3, 0.25, 0.2, 0.2, 0.03, 0.02])
+    status = rng.choice(4, size=total, p=[0.95, 0.03, 0.01, 0.01])
+    sign = np.select([tx_type == 0, tx_type == 5, tx_type == 2], [1, 1, rng.choice([-1, 1], total)], -1)
+    uniforms = rng.random(total)
+    amount = np.empty(total)
+    running_balance = np.empty(total)
+    _apply_transactions(opening_balance, interest_rate, offsets, tx_type, uniforms, sign, status, amount, running_balance)
+    expected_amount, expected_balance = _baseline_transactions(
+        opening_balance, interest_rate, offsets, tx_type, uniforms, sign, status
+    )
+    np.testing.assert_allclose(amount, expected_amount, rtol=0, atol=1e-9)
+    np.testing.assert_allclose(running_balance, expected_balance, rtol=0, atol=1e-9)
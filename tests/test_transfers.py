@@ -0,0 +1,66 @@
+"""Tests for picking fund transfer destinations"""
+import numpy as np
+import pandas as pd
+
+from banking_synthetic_data_app import generate_transfer_data
+
+def _strings(prefix, numbers):
+    """Arrow-backed strings like the generated ID and name columns"""
+    return pd.array(np.char.add(prefix, numbers.astype(str)), dtype="string[pyarrow]")
+
+def _accounts(customer_count, accounts_per_customer):
+    """Active accounts and their customers, each customer holding the given number of accounts"""
+    customer_numbers = np.arange(customer_count)
+    account_numbers = np.arange(customer_count * accounts_per_customer)
+    customers = pd.DataFrame({
+        "customer_id": _strings("CUST", customer_numbers),
+        "first_name": _strings("First", customer_numbers),
+        "last_name": _strings("Last", customer_numbers)
+    })
+    accounts = pd.DataFrame({
+        "account_id": _strings("ACCT", account_numbers),
+        "customer_id": _strings("CUST", np.repeat(customer_numbers, accounts_per_customer)),
+        "status": "Active",
+        "account_number": _strings("", account_numbers),
+        "current_balance": 1000.0,
+        "currency": "USD"
+    })
+    return accounts, customers
+
+def _internal(transfers):
+    """Rows of the internal transfers, whose destination is one of the generated accounts"""
+    return transfers[transfers["transfer_type"] == "Internal Transfer"]
+
+def test_transfers_never_target_their_source_account():
+    """No internal transfer goes back into the account it was drawn from, however few accounts there are"""
+    for customer_count, accounts_per_customer in ((1, 2), (2, 1), (3, 3), (500, 2)):
+        accounts, customers = _accounts(customer_count, accounts_per_customer)
+        transfers = _internal(generate_transfer_data(
+            accounts, customers, num_transfers=5_000, rng=np.random.default_rng(3)
+        ))
+        assert len(transfers) > 0
+        assert (transfers["destination_account_id"] != transfers["source_account_id"]).all()
+
+def test_internal_transfers_stay_with_the_customer_at_the_set_ratio():
+    """About 70% of internal transfers go to another account of the same customer"""
+    accounts, customers = _accounts(2_000, 2)
+    transfers = _internal(generate_transfer_data(
+        accounts, customers, num_transfers=40_000, rng=np.random.default_rng(5)
+    ))
+    owner = accounts.set_index("account_id")["customer_id"]
+    same_customer = (
+        owner.loc[transfers["source_account_id"]].to_numpy() == owner.loc[transfers["destination_account_id"]].to_numpy()
+    )
+    # About 10,000 internal transfers give a standard error under 0.005, and draws
+    # from any other account reach the sibling only once in 3,999
+    assert abs(same_customer.mean() - 0.7) < 0.03
+
+    # Customers with a single account can only send to somebody else
+    accounts, customers = _accounts(2_000, 1)
+    transfers = _internal(generate_transfer_data(
+        accounts, customers, num_transfers=5_000, rng=np.random.default_rng(5)
+    ))
+    owner = accounts.set_index("account_id")["customer_id"]
+    assert (
+        owner.loc[transfers["source_account_id"]].to_numpy() != owner.loc[transfers["destination_account_id"]].to_numpy()
+    ).all()